@@ -3,7 +3,9 @@ from enum import Enum
 from typing import Any, Callable, Dict, Optional
 
 import requests
+import ujson
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
 
 from era_5g_client.client_base import NetAppClientBase
 from era_5g_client.dataclasses import MiddlewareInfo
@@ -84,6 +86,13 @@ class NetAppClient(NetAppClientBase):
         self.args: Optional[Dict[str, Any]] = None
         self._switching: bool = False
 
+        # Persistent HTTP session for the Middleware calls (keep-alive and connection pooling). It is used only from
+        # the caller's thread, the resource checker thread has its own session (requests.Session is not thread-safe).
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
     def connect_to_middleware(self, middleware_info: MiddlewareInfo) -> None:
         """Authenticates with the Middleware and obtains a token for future calls.
 
@@ -207,7 +216,10 @@ class NetAppClient(NetAppClientBase):
         if not self._switching:
             if self.resource_checker is not None:
                 self.resource_checker.stop()
-            self.delete_all_resources()
+            try:
+                self.delete_all_resources()
+            finally:
+                self._session.close()
 
     def wait_until_netapp_ready(self) -> None:
         """Blocking wait until the 5G-ERA Network Application is running.
@@ -249,10 +261,10 @@ class NetAppClient(NetAppClientBase):
         self.logger.debug("Trying to log into the Middleware")
         # Request Login.
         try:
-            r = requests.post(
+            r = self._session.post(
                 self.middleware_info.build_api_endpoint("Login"), json={"Id": user_id, "Password": password}
             )
-            response = r.json()
+            response = ujson.loads(r.content)
             if "errors" in response:
                 raise FailedToConnect(str(response["errors"]))
             new_token = response["token"]  # Token is stored here.
@@ -261,7 +273,7 @@ class NetAppClient(NetAppClientBase):
                 raise FailedToConnect("Invalid token.")
             return new_token
 
-        except requests.HTTPError as e:
+        except HTTPError as e:
             if e.response:
                 raise FailedToConnect(
                     f"Could not login to the Middleware gateway, status code:" f" {e.response.status_code}"
@@ -294,8 +306,8 @@ class NetAppClient(NetAppClientBase):
             "DisableResourceReuse": resource_lock,
             "RobotId": robot_id,
         }
-        r = requests.post(self.middleware_info.build_api_endpoint("Task/Plan"), json=data, headers=hed)
-        response = r.json()
+        r = self._session.post(self.middleware_info.build_api_endpoint("Task/Plan"), json=data, headers=hed)
+        response = ujson.loads(r.content)
 
         if not isinstance(response, dict):
             raise FailedToConnect("Invalid response.")
@@ -329,7 +341,7 @@ class NetAppClient(NetAppClientBase):
                 url = self.middleware_info.build_api_endpoint(
                     f"orchestrate/orchestrate/plan/{str(self.action_plan_id)}"
                 )
-                response = requests.delete(url, headers=hed)
+                response = self._session.delete(url, headers=hed)
 
                 if response.ok:
                     self.logger.debug("Resource deleted")
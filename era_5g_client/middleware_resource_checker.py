@@ -1,15 +1,20 @@
 import logging
-import time
 from threading import Event, Thread
 from typing import Callable, Dict, Optional
 
 import requests
+import ujson
 from requests import HTTPError
 
 from era_5g_client.exceptions import FailedToConnect
 
 logger = logging.getLogger(__name__)
 
+# Resource status polling period, it grows up to the max value while the resource is not ready and its status does not
+# change.
+MIN_POLL_INTERVAL = 0.5
+MAX_POLL_INTERVAL = 2.0
+
 
 class MiddlewareResourceChecker(Thread):
     """Class for checking Middleware resources."""
@@ -41,6 +46,11 @@ class MiddlewareResourceChecker(Thread):
         self.status_endpoint = status_endpoint
         self.status: Optional[str] = None  # TODO define as enum?
         self.url: Optional[str] = None
+        # HTTP session used only by this thread, it is created on the first request and closed when the thread ends.
+        self._session: Optional[requests.Session] = None
+        # ETag of the last resource status response, the status is then requested conditionally.
+        self._etag: Optional[str] = None
+        self._last_resource_status: Optional[Dict] = None
 
     def stop(self) -> None:
         """Stop thread."""
@@ -53,21 +63,35 @@ class MiddlewareResourceChecker(Thread):
         Check resource status in loop.
         """
 
-        while not self.stop_event.is_set():
-            resource_state = self.get_resource_status()
-            seq = resource_state.get("actionSequence", [])
-            if seq:
-                services = seq[0].get("Services", [])
-                if services:
-                    self.resource_state = services[0]
-                    assert isinstance(self.resource_state, dict)
-                    self.status = self.resource_state.get("serviceStatus", None)
-                    old_url = self.url
-                    self.url = self.resource_state.get("serviceUrl", None)
-                    if old_url and self.url_changed_callback and old_url != self.url:
-                        self.url_changed_callback()
-                    logger.debug(f"{self.status=}, {self.url=}")
-            time.sleep(0.5)  # TODO: adjust or use something similar to rospy.rate.sleep()
+        try:
+            interval = MIN_POLL_INTERVAL
+            last_resource_state: Optional[Dict] = None
+            while not self.stop_event.is_set():
+                resource_state = self.get_resource_status()
+                if resource_state == last_resource_state:
+                    # Unchanged (or not modified) status, back off while waiting for the resource, once it is ready,
+                    # keep the short period, so the change of the URL (edge switchover) is detected quickly.
+                    interval = MIN_POLL_INTERVAL if self.is_ready() else min(MAX_POLL_INTERVAL, interval * 2)
+                else:
+                    last_resource_state = resource_state
+                    interval = MIN_POLL_INTERVAL
+                    seq = resource_state.get("actionSequence", [])
+                    if seq:
+                        services = seq[0].get("Services", [])
+                        if services:
+                            self.resource_state = services[0]
+                            assert isinstance(self.resource_state, dict)
+                            self.status = self.resource_state.get("serviceStatus", None)
+                            old_url = self.url
+                            self.url = self.resource_state.get("serviceUrl", None)
+                            if old_url and self.url_changed_callback and old_url != self.url:
+                                self.url_changed_callback()
+                            logger.debug(f"{self.status=}, {self.url=}")
+                self.stop_event.wait(interval)
+        finally:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
 
     def get_resource_status(self) -> Dict:
         """Get resource status.
@@ -77,18 +101,27 @@ class MiddlewareResourceChecker(Thread):
         """
 
         hed = {"Authorization": "Bearer " + str(self.token)}
+        if self._etag and self._last_resource_status is not None:
+            hed["If-None-Match"] = self._etag
         url = f"{self.status_endpoint}/{str(self.action_plan_id)}"
 
+        if self._session is None:
+            self._session = requests.Session()
         try:  # Query orchestrator for latest information regarding the status of resources.
-            response = requests.get(url, headers=hed)
+            response = self._session.get(url, headers=hed)
         except HTTPError as e:
             if e.response:
                 logger.debug(e.response.status_code)
             else:
                 logger.debug(e)
             raise FailedToConnect(f"Could not get the resource status, revisit the log files for more details. {e}")
-        resp = response.json()
+        if response.status_code == 304 and self._last_resource_status is not None:
+            # Not modified, skip decoding of the response.
+            return self._last_resource_status
+        resp = ujson.loads(response.content)
         if isinstance(resp, dict):
+            self._etag = response.headers.get("ETag")
+            self._last_resource_status = resp
             return resp
         else:
             raise FailedToConnect("Invalid response.")
@@ -106,7 +139,7 @@ class MiddlewareResourceChecker(Thread):
 
             if self.is_ready():
                 return
-            time.sleep(0.1)
+            self.stop_event.wait(0.1)
 
     def is_ready(self) -> bool:
         """Is resource ready?
@@ -1,19 +1,22 @@
 import logging
 import os
+import queue
 import signal
 import sys
 import time
 import traceback
+from contextlib import suppress
+from threading import Event
 from typing import Any, Dict
 
 import cv2
+import numpy as np
 
 from era_5g_client.client import NetAppClient, RunTaskMode
 from era_5g_client.dataclasses import MiddlewareInfo
 from era_5g_client.exceptions import FailedToConnect
 from era_5g_interface.channels import CallbackInfoClient, ChannelType
-
-stopped = False
+from examples.frame_sender import FrameSender
 
 # Video from source flag
 FROM_SOURCE = os.getenv("FROM_SOURCE", "").lower() in ("true", "1")
@@ -57,13 +60,11 @@ def main() -> None:
     """Creates the client class and starts the data transfer."""
 
     client = None
-    global stopped
-    stopped = False
+    stop_event = Event()
 
     def signal_handler(sig: int, *_) -> None:
         logging.info(f"Terminating ({signal.Signals(sig).name})...")
-        global stopped
-        stopped = True
+        stop_event.set()
 
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
@@ -81,19 +82,46 @@ def main() -> None:
             cap = cv2.VideoCapture(0)
             if not cap.isOpened():
                 raise Exception("Cannot open camera")
+            # ask the camera for the target resolution, so the frames do not have to be resized
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            # keep only the latest frame in the driver buffer to avoid latency build-up
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         else:
             # or from video file
             cap = cv2.VideoCapture(TEST_VIDEO_FILE)
             if not cap.isOpened():
                 raise Exception("Cannot open video file")
 
-        while not stopped:
+        # Preallocated buffers for resized frames, returned back once the frame is sent or dropped.
+        free_buffers: queue.Queue = queue.Queue(maxsize=4)
+
+        def release_buffer(buffer: np.ndarray) -> None:
+            with suppress(queue.Full):
+                free_buffers.put_nowait(buffer)
+
+        # Camera frames are dropped if the sending can't keep up, frames from the video file are never skipped.
+        sender = FrameSender(
+            client, stop_event, queue_size=2, drop_oldest=FROM_SOURCE, release_callback=release_buffer, daemon=True
+        )
+        sender.start()
+
+        while not stop_event.is_set():
             ret, frame = cap.read()
             timestamp = time.perf_counter_ns()
             if not ret:
                 break
-            resized = cv2.resize(frame, (640, 480), interpolation=cv2.INTER_AREA)
-            client.send_image(resized, "image", ChannelType.JPEG, timestamp)
+            if frame.shape[:2] == (480, 640):
+                resized = frame
+            else:
+                try:
+                    resized = free_buffers.get_nowait()
+                except queue.Empty:
+                    resized = np.empty((480, 640, 3), dtype=np.uint8)
+                resized = cv2.resize(frame, (640, 480), dst=resized, interpolation=cv2.INTER_AREA)
+            sender.submit(resized, timestamp)
+
+        sender.finish()
 
     except FailedToConnect as ex:
         print(f"Failed to connect to server ({ex})")
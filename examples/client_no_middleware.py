@@ -4,6 +4,7 @@ import signal
 import sys
 import time
 import traceback
+from threading import Event
 from typing import Any, Dict
 
 import cv2
@@ -11,11 +12,12 @@ import cv2
 from era_5g_client.client_base import NetAppClientBase
 from era_5g_client.exceptions import FailedToConnect
 from era_5g_interface.channels import CallbackInfoClient, ChannelType
-
-stopped = False
+from examples.frame_sender import FrameSender
 
 # Video from source flag
 FROM_SOURCE = os.getenv("FROM_SOURCE", "").lower() in ("true", "1")
+# Decode and resize the test video file with GStreamer (requires OpenCV built with GStreamer support)
+USE_GSTREAMER = os.getenv("USE_GSTREAMER", "").lower() in ("true", "1")
 # URL of the network application, including the schema and port (e.g., http://localhost:5896)
 NETAPP_ADDRESS = os.getenv("NETAPP_ADDRESS", "http//localhost:5896")
 
@@ -47,12 +49,10 @@ def main() -> None:
     """Creates the client class and starts the data transfer."""
 
     client = None
-    global stopped
-    stopped = False
+    stop_event = Event()
 
     def signal_handler(sig: int, *_) -> None:
-        global stopped
-        stopped = True
+        stop_event.set()
         print(f"Terminating ({signal.Signals(sig).name})...")
 
     signal.signal(signal.SIGTERM, signal_handler)
@@ -69,19 +69,39 @@ def main() -> None:
             cap = cv2.VideoCapture(0)
             if not cap.isOpened():
                 raise Exception("Cannot open camera")
+            # ask the camera for the target resolution, so the frames do not have to be resized
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            # keep only the latest frame in the driver buffer to avoid latency build-up
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         else:
             # or from video file
-            cap = cv2.VideoCapture(TEST_VIDEO_FILE)
+            if USE_GSTREAMER:
+                # GStreamer delivers already resized frames, appsink keeps at most one frame and is not clock synced
+                cap = cv2.VideoCapture(
+                    f'filesrc location="{TEST_VIDEO_FILE}" ! decodebin ! videoconvert ! videoscale ! '
+                    "video/x-raw,format=BGR,width=640,height=480 ! appsink max-buffers=1 sync=false",
+                    cv2.CAP_GSTREAMER,
+                )
+            else:
+                cap = cv2.VideoCapture(TEST_VIDEO_FILE)
             if not cap.isOpened():
                 raise Exception("Cannot open video file")
 
-        while not stopped:
+        # Only the latest camera frame waits for sending, frames from the video file are never skipped.
+        sender = FrameSender(client, stop_event, queue_size=1, drop_oldest=FROM_SOURCE, daemon=True)
+        sender.start()
+
+        while not stop_event.is_set():
             ret, frame = cap.read()
-            timestamp = time.time_ns()
+            timestamp = time.perf_counter_ns()
             if not ret:
                 break
-            resized = cv2.resize(frame, (640, 480), interpolation=cv2.INTER_AREA)
-            client.send_image(resized, "image", ChannelType.JPEG, timestamp)
+            if frame.shape[:2] != (480, 640):
+                frame = cv2.resize(frame, (640, 480), interpolation=cv2.INTER_AREA)
+            sender.submit(frame, timestamp)
+
+        sender.finish()
 
     except FailedToConnect as ex:
         print(f"Failed to connect to server ({ex})")
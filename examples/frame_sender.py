@@ -0,0 +1,150 @@
+import logging
+import queue
+import traceback
+from contextlib import suppress
+from threading import Event, Thread
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from era_5g_client.client_base import NetAppClientBase
+from era_5g_interface.channels import ChannelType
+from era_5g_interface.exceptions import BackPressureException
+
+logger = logging.getLogger(__name__)
+
+# How long to wait before sending a frame again after back pressure, in seconds.
+BACK_PRESSURE_RETRY_INTERVAL = 0.01
+
+
+class FrameSender(Thread):
+    """Sends frames from a separate thread, so the capture does not wait for the encoding and the network."""
+
+    def __init__(
+        self,
+        client: NetAppClientBase,
+        stop_event: Event,
+        queue_size: int = 2,
+        drop_oldest: bool = True,
+        release_callback: Optional[Callable[[np.ndarray], None]] = None,
+        **kw,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            client (NetAppClientBase): Client used for sending the frames.
+            stop_event (Event): Stops the sending, it is set by the sender on unexpected error.
+            queue_size (int): Max number of frames waiting for sending.
+            drop_oldest (bool): If the queue is full or on back pressure, drop the frame (live sources), otherwise wait
+                for a free slot or send the frame again later, so no frame is skipped (video files).
+            release_callback (Callable, optional): Called with the frame once it is sent or dropped.
+            **kw: Thread arguments.
+        """
+
+        super().__init__(**kw)
+        self.client = client
+        self.stop_event = stop_event
+        self.drop_oldest = drop_oldest
+        self.release_callback = release_callback
+        # Number of frames dropped due to back pressure.
+        self.dropped_frames = 0
+        self._frames: queue.Queue = queue.Queue(maxsize=queue_size)
+
+    def submit(self, frame: np.ndarray, timestamp: int) -> None:
+        """Queues the frame for sending.
+
+        Args:
+            frame (np.ndarray): Video frame.
+            timestamp (int): Frame timestamp.
+        """
+
+        if self.drop_oldest:
+            dropped = self._put_drop_oldest((frame, timestamp))
+            if dropped is not None:
+                self._release(dropped[0])
+        else:
+            self._put((frame, timestamp))
+
+    def finish(self) -> None:
+        """Signals the end of the stream and waits until the sender ends."""
+
+        # The end of the stream is queued behind the waiting frames, none of them is dropped.
+        self._put(None)
+        self.join()
+        logger.info(f"Frames dropped due to back pressure: {self.dropped_frames}")
+
+    def run(self) -> None:
+        """Run thread.
+
+        Send queued frames until the end of the stream or the stop event.
+        """
+
+        while not self.stop_event.is_set():
+            try:
+                item = self._frames.get(timeout=1)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+            self._send(item)
+            self._release(item[0])
+
+    def _send(self, item: Tuple[np.ndarray, int]) -> None:
+        """Sends the frame, on back pressure it is dropped (live sources) or sent again later (video files).
+
+        Args:
+            item (Tuple[np.ndarray, int]): Frame and its timestamp.
+        """
+
+        while not self.stop_event.is_set():
+            try:
+                self.client.send_image(item[0], "image", ChannelType.JPEG, item[1])
+            except BackPressureException:
+                if self.drop_oldest:
+                    # the network can't keep up, drop the frame, the capture continues with the newest frames
+                    self.dropped_frames += 1
+                    return
+                # wait until the outgoing queue is drained a bit and send the same frame again
+                self.stop_event.wait(BACK_PRESSURE_RETRY_INTERVAL)
+                continue
+            except Exception:
+                traceback.print_exc()
+                self.stop_event.set()
+            return
+
+    def _release(self, frame: np.ndarray) -> None:
+        if self.release_callback is not None:
+            self.release_callback(frame)
+
+    def _put(self, item: Optional[Tuple[np.ndarray, int]]) -> None:
+        """Puts the item into the queue, waits for a free slot until the stop event is set.
+
+        Args:
+            item (Tuple[np.ndarray, int], optional): Frame and its timestamp, None signals the end of the stream.
+        """
+
+        while not self.stop_event.is_set():
+            try:
+                self._frames.put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
+
+    def _put_drop_oldest(self, item: Tuple[np.ndarray, int]) -> Optional[Tuple[np.ndarray, int]]:
+        """Puts the item into the queue without blocking, the oldest item is dropped if the queue is full.
+
+        Args:
+            item (Tuple[np.ndarray, int]): Frame and its timestamp.
+
+        Returns:
+            The dropped item or None.
+        """
+
+        dropped = None
+        try:
+            self._frames.put_nowait(item)
+        except queue.Full:
+            with suppress(queue.Empty):
+                dropped = self._frames.get_nowait()
+            self._frames.put_nowait(item)
+        return dropped
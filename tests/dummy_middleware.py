@@ -1,3 +1,4 @@
+import itertools
 import uuid
 from typing import Tuple
 
@@ -8,12 +9,14 @@ app = Flask(__name__)
 
 url = "http://localhost:5800"
 counter = 1
+# Counter based ids, distinct ids are sufficient for testing and cheaper than uuid4.
+id_counter = itertools.count(1)
 
 
 @app.route("/Login", methods=["POST"])
 def login() -> Tuple[Response, int]:
-    # Generate a random token
-    token = str(uuid.uuid4())
+    # Generate a unique token
+    token = str(uuid.UUID(int=next(id_counter)))
     return jsonify({"token": token}), 200
 
 
@@ -21,7 +24,7 @@ def login() -> Tuple[Response, int]:
 def create_task_plan() -> Response:
     global counter
     counter = 1
-    action_plan_id = str(uuid.uuid4())
+    action_plan_id = str(uuid.UUID(int=next(id_counter)))
     response = {"ActionPlanId": action_plan_id}
     return jsonify(response)
 
@@ -45,4 +48,4 @@ def delete_orchestrated_plan(action_plan_id: str) -> Response:
 
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    app.run()
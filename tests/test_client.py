@@ -13,17 +13,19 @@ from era_5g_interface.channels import COMMAND_EVENT, CONTROL_NAMESPACE, DATA_NAM
 from era_5g_interface.exceptions import BackPressureException
 
 
-def find_free_port():
+def find_free_port() -> int:
     with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-        s.bind(("", 0))
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        return s.getsockname()[1]
+        s.bind(("", 0))
+        return int(s.getsockname()[1])
 
 
-port = find_free_port()
+@pytest.fixture(scope="session")
+def port() -> int:
+    return find_free_port()
 
 
-def test_client_send_data() -> None:
+def test_client_send_data(port: int) -> None:
     got_data = Event()
 
     def json_callback_websocket(sid: str, data: Dict[str, Any]) -> None:
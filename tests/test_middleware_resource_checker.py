@@ -0,0 +1,115 @@
+from threading import Event
+from typing import Dict, List, Optional
+
+import pytest
+import requests
+
+from era_5g_client.middleware_resource_checker import MAX_POLL_INTERVAL, MIN_POLL_INTERVAL, MiddlewareResourceChecker
+
+
+def make_response(status_code: int, content: bytes = b"", etag: Optional[str] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    if etag is not None:
+        response.headers["ETag"] = etag
+    return response
+
+
+class StubSession(requests.Session):
+    def __init__(self, responses: List[requests.Response]) -> None:
+        super().__init__()
+        self.responses = responses
+        self.sent_headers: List[Dict[str, str]] = []
+
+    def get(self, url, **kwargs) -> requests.Response:
+        self.sent_headers.append(dict(kwargs.get("headers", {})))
+        return self.responses.pop(0)
+
+
+def test_resource_status_etag(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = StubSession(
+        [
+            make_response(200, b'{"actionSequence": [], "version": 1}', etag='"1"'),
+            make_response(304),
+            make_response(200, b'{"actionSequence": [], "version": 2}', etag='"2"'),
+            make_response(304),
+        ]
+    )
+    monkeypatch.setattr(requests, "Session", lambda: session)
+    checker = MiddlewareResourceChecker("token", "plan", "http://middleware/plan")
+
+    # The first response is decoded and its ETag is stored.
+    first = checker.get_resource_status()
+    assert first == {"actionSequence": [], "version": 1}
+    assert "If-None-Match" not in session.sent_headers[0]
+
+    # Not modified, the cached status is returned.
+    assert checker.get_resource_status() is first
+    assert session.sent_headers[1]["If-None-Match"] == '"1"'
+
+    # Modified, the new status replaces the cached one.
+    second = checker.get_resource_status()
+    assert second == {"actionSequence": [], "version": 2}
+    assert session.sent_headers[2]["If-None-Match"] == '"1"'
+
+    # The replaced status and its ETag are used from now on.
+    assert checker.get_resource_status() is second
+    assert session.sent_headers[3]["If-None-Match"] == '"2"'
+
+
+class RecordingEvent(Event):
+    """Stop event which records the waiting intervals and stops the checker after the given number of waits."""
+
+    def __init__(self, waits: int) -> None:
+        super().__init__()
+        self.waits = waits
+        self.intervals: List[float] = []
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        assert timeout is not None
+        self.intervals.append(timeout)
+        if len(self.intervals) >= self.waits:
+            self.set()
+        return self.is_set()
+
+
+def plan_status(status: str) -> bytes:
+    return (
+        b'{"actionSequence": [{"Services": [{"serviceStatus": "'
+        + status.encode()
+        + b'", "serviceUrl": "http://netapp"}]}]}'
+    )
+
+
+def test_resource_status_polling_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = StubSession(
+        [
+            make_response(200, plan_status("Pending"), etag='"1"'),
+            make_response(304),
+            make_response(304),
+            make_response(200, plan_status("Pending"), etag='"1"'),
+            make_response(200, plan_status("Active"), etag='"2"'),
+            make_response(304),
+            make_response(304),
+        ]
+    )
+    monkeypatch.setattr(requests, "Session", lambda: session)
+    checker = MiddlewareResourceChecker("token", "plan", "http://middleware/plan")
+    stop_event = RecordingEvent(waits=7)
+    checker.stop_event = stop_event
+
+    checker.run()
+
+    # Backs off while the status does not change, resets on change and keeps the short period once ready.
+    assert stop_event.intervals == [
+        MIN_POLL_INTERVAL,
+        2 * MIN_POLL_INTERVAL,
+        MAX_POLL_INTERVAL,
+        MAX_POLL_INTERVAL,
+        MIN_POLL_INTERVAL,
+        MIN_POLL_INTERVAL,
+        MIN_POLL_INTERVAL,
+    ]
+    assert checker.is_ready()
+    assert checker._session is None